@@ -4,21 +4,41 @@ Content Feed Migrator for FocusFerry
 Migrates existing YouTube data to unified content feed format
 """
 
-import os
-import json
+import sys
 from pathlib import Path
 from datetime import datetime
 
+# Add scripts directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+
+from _jsonio import load_feed, save_feed
+from content_integrator import published_at_key
+
+def get_migration_fingerprint(youtube_file, content_feed_file):
+    """Cheap fingerprint of the migration input and output (mtime + size)"""
+    src_stat = youtube_file.stat()
+    return {
+        "src_mtime_ns": src_stat.st_mtime_ns,
+        "src_size": src_stat.st_size,
+        "dst_mtime_ns": content_feed_file.stat().st_mtime_ns if content_feed_file.exists() else None
+    }
+
 def migrate_youtube_to_unified():
     """Migrate YouTube videos to unified content feed"""
     
     # Paths
     youtube_file = Path(__file__).parent.parent / "data" / "youtube" / "matthew_berman_videos.json"
     content_feed_file = Path(__file__).parent.parent / "data" / "content_feed.json"
+    cache_file = Path(__file__).parent.parent / "data" / ".migrate.cache"
+    
+    # Skip all work if neither the YouTube source nor the migrated feed
+    # changed since the last successful run
+    if cache_file.exists() and load_feed(cache_file) == get_migration_fingerprint(youtube_file, content_feed_file):
+        print("ℹ️  YouTube data unchanged since last migration - no-op")
+        return
     
     # Read existing YouTube data
-    with open(youtube_file, 'r', encoding='utf-8') as f:
-        youtube_data = json.load(f)
+    youtube_data = load_feed(youtube_file)
     
     # Create unified content feed
     content_feed = {
@@ -60,16 +80,13 @@ def migrate_youtube_to_unified():
         print(f"✅ Migrated: {video['title']}")
     
     # Sort by published date (newest first)
-    content_feed['items'].sort(
-        key=lambda x: x['metadata']['published_at'], 
-        reverse=True
-    )
+    content_feed['items'].sort(key=published_at_key, reverse=True)
     
     content_feed['total_items'] = len(content_feed['items'])
     
     # Save unified content feed
-    with open(content_feed_file, 'w', encoding='utf-8') as f:
-        json.dump(content_feed, f, indent=2, ensure_ascii=False)
+    save_feed(content_feed_file, content_feed)
+    save_feed(cache_file, get_migration_fingerprint(youtube_file, content_feed_file))
     
     print(f"\n🎉 Migration complete!")
     print(f"📊 Total items: {content_feed['total_items']}")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+JSON I/O helpers for FocusFerry
+Shared load/save for the data/ feed files, backed by orjson when available
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+    HAVE_IJSON = True
+except ImportError:  # ijson is an optional speedup
+    HAVE_IJSON = False
+
+
+def load_feed(path):
+    """Load a JSON feed file (content feed, RSS or YouTube data)"""
+    path = Path(path)
+
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def atomic_write(path, payload):
+    """Write bytes to path atomically: temp file in the same directory + os.replace
+
+    A crash mid-write leaves the previous file intact instead of a torn one.
+    """
+    path = Path(path)
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp', delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+        try:
+            tmp.write(payload)
+        except BaseException:
+            tmp.close()
+            tmp_path.unlink()
+            raise
+
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+def save_feed(path, data):
+    """Save a JSON feed file as indented UTF-8 (same layout as json.dump indent=2)"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    atomic_write(path, payload)
+
+
+def iter_feed_items(path):
+    """Yield the entries of a feed's top-level 'items' list one by one
+
+    With ijson installed the file is streamed, so scanning for a few entries
+    never materializes the whole feed; otherwise it falls back to load_feed.
+    """
+    path = Path(path)
+
+    if not HAVE_IJSON:
+        yield from load_feed(path).get('items', [])
+        return
+
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'items.item')
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+OpenRouter client for FocusFerry
+Shared chat-completion call for the AI summarization scripts
+"""
+
+import atexit
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+OPENROUTER_URL = 'https://openrouter.ai/api/v1/chat/completions'
+DEFAULT_MODEL = 'google/gemini-2.5-flash'
+OPENROUTER_TIMEOUT = 60
+
+# Size of the connection pool, i.e. how many calls can be in flight at once
+MAX_CONNECTIONS = 8
+
+# One keep-alive session for all OpenRouter calls, so only the first request
+# pays the TCP+TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
+atexit.register(_SESSION.close)
+
+
+def complete(prompt, *, max_tokens, temperature, model=DEFAULT_MODEL):
+    """Send a single user prompt to OpenRouter and return the stripped reply"""
+    api_key = os.getenv('OPENROUTER_API_KEY')
+    
+    if not api_key or api_key == 'your_openrouter_api_key_here':
+        raise ValueError("OPENROUTER_API_KEY not set in .env file")
+    
+    headers = {
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json'
+    }
+    
+    data = {
+        'model': model,
+        'messages': [
+            {
+                'role': 'user',
+                'content': prompt
+            }
+        ],
+        'max_tokens': max_tokens,
+        'temperature': temperature
+    }
+    
+    response = _SESSION.post(
+        OPENROUTER_URL,
+        headers=headers,
+        json=data,
+        timeout=OPENROUTER_TIMEOUT
+    )
+    
+    if response.status_code != 200:
+        raise Exception(f"OpenRouter API error: {response.status_code} - {response.text}")
+    
+    result = response.json()
+    return result['choices'][0]['message']['content'].strip()
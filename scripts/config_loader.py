@@ -7,7 +7,16 @@ Handles loading and validation of content source configuration
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# Prefer the libyaml-backed C loader/dumper; fall back to pure Python
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Parsed configs shared across ConfigLoader instances: path -> (mtime_ns, config)
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
 
 class ConfigLoader:
     """Loads and validates FocusFerry configuration"""
@@ -23,11 +32,19 @@ class ConfigLoader:
         if not self.config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
         
+        # Reuse the parsed config as long as the file hasn't changed on disk
+        mtime_ns = self.config_file.stat().st_mtime_ns
+        cached = _CONFIG_CACHE.get(self.config_file)
+        if cached and cached[0] == mtime_ns:
+            self._config = cached[1]
+            return self._config
+        
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+                self._config = yaml.load(f, Loader=SafeLoader)
                 
             self._validate_config()
+            _CONFIG_CACHE[self.config_file] = (mtime_ns, self._config)
             return self._config
             
         except yaml.YAMLError as e:
@@ -98,9 +115,10 @@ class ConfigLoader:
         """Save configuration to YAML file"""
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, allow_unicode=True, indent=2)
+                yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, indent=2)
             
             self._config = config
+            _CONFIG_CACHE[self.config_file] = (self.config_file.stat().st_mtime_ns, config)
             
         except Exception as e:
             raise RuntimeError(f"Error saving configuration: {e}")
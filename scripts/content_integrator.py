@@ -4,10 +4,25 @@ Content Integrator for FocusFerry
 Integrates RSS articles into the unified content feed alongside YouTube videos
 """
 
-import json
+import heapq
 from datetime import datetime
 from pathlib import Path
 
+from _jsonio import load_feed, save_feed
+
+def published_at_key(item):
+    """Sort key for feed items: publication time as a POSIX timestamp
+    
+    published_at strings mix offsets ('Z', '+00:00', '-04:00', naive local
+    time from the RSS fallback), so comparing the raw strings can misorder
+    items. The key is computed once per item by sort()/merge() and compared
+    as a float afterwards.
+    """
+    try:
+        return datetime.fromisoformat(item['metadata']['published_at'].replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return 0.0
+
 def integrate_rss_to_content_feed():
     """Integrate RSS articles into the unified content feed"""
     
@@ -17,8 +32,7 @@ def integrate_rss_to_content_feed():
     
     # Read existing content feed
     if content_feed_file.exists():
-        with open(content_feed_file, 'r', encoding='utf-8') as f:
-            content_feed = json.load(f)
+        content_feed = load_feed(content_feed_file)
         print(f"📂 Loaded existing content feed with {content_feed['total_items']} items")
     else:
         # Create new content feed if it doesn't exist
@@ -34,22 +48,30 @@ def integrate_rss_to_content_feed():
         print(f"❌ RSS file not found: {rss_file}")
         return False
     
-    with open(rss_file, 'r', encoding='utf-8') as f:
-        rss_data = json.load(f)
+    rss_data = load_feed(rss_file)
     
     print(f"📰 Found {rss_data['total_articles']} articles from {rss_data['source_name']}")
     
     # Convert RSS articles to unified content feed format
     new_items = []
-    existing_ids = {item['id'] for item in content_feed['items']}
+    existing_ids = frozenset(item['id'] for item in content_feed['items'])
     
+    # Key articles by unified item ID in file order (the first copy of a
+    # duplicate within one RSS file wins), then find the new ones with one
+    # set difference
+    articles_by_id = {}
     for article in rss_data['articles']:
-        # Create unified item ID
-        unified_id = f"rss_{rss_data['source_name']}_{article['article_id']}"
-        
-        # Skip if already exists
-        if unified_id in existing_ids:
-            print(f"⏭️  Skipping existing article: {article['title']}")
+        articles_by_id.setdefault(f"rss_{rss_data['source_name']}_{article['article_id']}", article)
+    new_ids = articles_by_id.keys() - existing_ids
+    
+    skipped_count = len(articles_by_id) - len(new_ids)
+    if skipped_count:
+        print(f"⏭️  Skipping {skipped_count} existing articles")
+    
+    # Walk the articles in file order rather than the set: its order depends
+    # on the hash seed, and ties in published_at must keep a stable order
+    for unified_id, article in articles_by_id.items():
+        if unified_id not in new_ids:
             continue
         
         # Convert to unified format
@@ -81,22 +103,33 @@ def integrate_rss_to_content_feed():
         print("ℹ️  No new articles to add")
         return True
     
-    # Add new items to content feed
-    content_feed['items'].extend(new_items)
-    
-    # Sort all items by published date (newest first)
-    content_feed['items'].sort(
-        key=lambda x: x['metadata']['published_at'], 
-        reverse=True
-    )
+    # Merge new items into the feed, keeping it sorted by published date
+    # (newest first). Writers keep the existing feed sorted, so usually only
+    # the new items need sorting: O(K log K + N) instead of a full
+    # O(N log N) re-sort. Feeds written before published_at_key compared
+    # timestamps may be string-sorted with mixed offsets; one O(N) check
+    # catches that and re-sorts everything once.
+    existing_keys = [published_at_key(item) for item in content_feed['items']]
+    if all(a >= b for a, b in zip(existing_keys, existing_keys[1:])):
+        new_items.sort(key=published_at_key, reverse=True)
+        content_feed['items'] = list(heapq.merge(
+            content_feed['items'], new_items,
+            key=published_at_key,
+            reverse=True
+        ))
+    else:
+        content_feed['items'] = sorted(
+            content_feed['items'] + new_items,
+            key=published_at_key,
+            reverse=True
+        )
     
     # Update metadata
     content_feed['total_items'] = len(content_feed['items'])
     content_feed['generated_at'] = datetime.now().isoformat()
     
     # Save updated content feed
-    with open(content_feed_file, 'w', encoding='utf-8') as f:
-        json.dump(content_feed, f, indent=2, ensure_ascii=False)
+    save_feed(content_feed_file, content_feed)
     
     print(f"\n🎉 Content feed integration complete!")
     print(f"📊 Total items in feed: {content_feed['total_items']}")
@@ -4,24 +4,27 @@ Content Summarizer for FocusFerry
 Task 2.2: Generate AI summaries for articles using OpenRouter AI
 """
 
-import os
-import json
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 
+from _jsonio import HAVE_IJSON, iter_feed_items, load_feed, save_feed
+from _openrouter import MAX_CONNECTIONS, complete
+
 # Load environment variables
 load_dotenv()
 
-def translate_title_with_openrouter(title):
-    """Translate article title to Dutch using OpenRouter AI"""
-    api_key = os.getenv('OPENROUTER_API_KEY')
-    
-    if not api_key or api_key == 'your_openrouter_api_key_here':
-        raise ValueError("OPENROUTER_API_KEY not set in .env file")
-    
-    prompt = f"""Je bent een tech journalist. Vertaal deze Engelse artikeltitel naar het Nederlands.
+CONTENT_FEED_PATH = Path(__file__).parent.parent / "data" / "content_feed.json"
+
+# Records the feed mtime at which every RSS article was known to be summarized
+SUMMARIZED_STAMP_PATH = Path(__file__).parent.parent / "data" / ".summarized_feed_mtime"
+
+# Upper bound on in-flight OpenRouter requests (one pooled connection each)
+MAX_CONCURRENT_REQUESTS = MAX_CONNECTIONS
+
+# Prompts are built once at import; only the article fields vary per call
+TITLE_PROMPT_TEMPLATE = """Je bent een tech journalist. Vertaal deze Engelse artikeltitel naar het Nederlands.
 
 Regels voor de vertaling:
 - Behoud technische termen die gangbaar zijn in het Nederlands (AI, API, GPU, etc.)
@@ -34,48 +37,7 @@ Engelse titel: {title}
 
 Nederlandse titel:"""
 
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
-    data = {
-        'model': 'google/gemini-2.5-flash',
-        'messages': [
-            {
-                'role': 'user',
-                'content': prompt
-            }
-        ],
-        'max_tokens': 50,
-        'temperature': 0.5
-    }
-    
-    response = requests.post(
-        'https://openrouter.ai/api/v1/chat/completions',
-        headers=headers,
-        json=data
-    )
-    
-    if response.status_code != 200:
-        raise Exception(f"OpenRouter API error: {response.status_code} - {response.text}")
-    
-    result = response.json()
-    translated_title = result['choices'][0]['message']['content'].strip()
-    
-    # Remove quotes if AI added them
-    translated_title = translated_title.strip('"\'')
-    
-    return translated_title
-
-def summarize_with_openrouter(title, description):
-    """Generate summary using OpenRouter AI (Gemini 2.5 Flash)"""
-    api_key = os.getenv('OPENROUTER_API_KEY')
-    
-    if not api_key or api_key == 'your_openrouter_api_key_here':
-        raise ValueError("OPENROUTER_API_KEY not set in .env file")
-    
-    prompt = f"""Je bent een tech journalist die nieuwsartikelen samenvat voor techneuten. 
+SUMMARY_PROMPT_TEMPLATE = """Je bent een tech journalist die nieuwsartikelen samenvat voor techneuten. 
 
 Maak een samenvatting van dit artikel in maximaal 400 karakters. De samenvatting moet:
 - Technisch accuraat zijn maar begrijpelijk voor iemand met basiskennis van AI/tech
@@ -89,34 +51,26 @@ Artikel beschrijving: {description}
 
 Samenvatting (max 400 karakters):"""
 
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
-    data = {
-        'model': 'google/gemini-2.5-flash',
-        'messages': [
-            {
-                'role': 'user',
-                'content': prompt
-            }
-        ],
-        'max_tokens': 200,
-        'temperature': 0.7
-    }
-    
-    response = requests.post(
-        'https://openrouter.ai/api/v1/chat/completions',
-        headers=headers,
-        json=data
+def translate_title_with_openrouter(title):
+    """Translate article title to Dutch using OpenRouter AI"""
+    translated_title = complete(
+        TITLE_PROMPT_TEMPLATE.format(title=title),
+        max_tokens=50,
+        temperature=0.5
     )
     
-    if response.status_code != 200:
-        raise Exception(f"OpenRouter API error: {response.status_code} - {response.text}")
+    # Remove quotes if AI added them
+    translated_title = translated_title.strip('"\'')
     
-    result = response.json()
-    summary = result['choices'][0]['message']['content'].strip()
+    return translated_title
+
+def summarize_with_openrouter(title, description):
+    """Generate summary using OpenRouter AI (Gemini 2.5 Flash)"""
+    summary = complete(
+        SUMMARY_PROMPT_TEMPLATE.format(title=title, description=description),
+        max_tokens=200,
+        temperature=0.7
+    )
     
     # Remove any "Samenvatting:" prefix if AI added it
     if summary.lower().startswith('samenvatting:'):
@@ -126,78 +80,116 @@ Samenvatting (max 400 karakters):"""
 
 def get_content_feed():
     """Load the unified content feed"""
-    content_feed_path = Path(__file__).parent.parent / "data" / "content_feed.json"
+    data = load_feed(CONTENT_FEED_PATH)
     
-    with open(content_feed_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    return data, content_feed_path
+    return data, CONTENT_FEED_PATH
 
-def save_content_feed(data, content_path):
+def save_content_feed(data, content_path, generated_at=None):
     """Save the updated content feed"""
-    data['generated_at'] = datetime.now().isoformat()
+    data['generated_at'] = generated_at or datetime.now().isoformat()
     
-    with open(content_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    save_feed(content_path, data)
     
     print(f"💾 Updated content feed: {content_path}")
 
+def is_feed_fully_summarized():
+    """Check if the feed is unchanged since a run left nothing to process"""
+    try:
+        stamp = SUMMARIZED_STAMP_PATH.read_text().strip()
+        return stamp == str(CONTENT_FEED_PATH.stat().st_mtime_ns)
+    except OSError:
+        return False
+
+def mark_feed_summarized():
+    """Remember the current feed mtime as fully summarized"""
+    SUMMARIZED_STAMP_PATH.write_text(str(CONTENT_FEED_PATH.stat().st_mtime_ns))
+
+def needs_processing(item):
+    """Check if a feed item is an RSS article without summary OR without Dutch title"""
+    return (item['source']['platform'] == 'rss' and 
+            ('ai_summary' not in item['content'] or 'dutch_title' not in item['content']))
+
+def process_rss_article(article, summarized_at):
+    """Add the missing Dutch title and/or AI summary to a single RSS article"""
+    title = article['content']['title']
+    
+    # Generate Dutch title if missing
+    if 'dutch_title' not in article['content']:
+        dutch_title = translate_title_with_openrouter(title)
+        article['content']['dutch_title'] = dutch_title
+        print(f"🔤 Dutch title for '{title}': {dutch_title}")
+    
+    # Generate summary if missing
+    if 'ai_summary' not in article['content']:
+        summary = summarize_with_openrouter(title, article['content']['description'])
+        
+        if len(summary) > 400:
+            print(f"⚠️  Warning: Summary for '{title}' is {len(summary)} chars (over 400 limit)")
+        
+        article['content']['ai_summary'] = summary
+        article['metadata']['summarized_at'] = summarized_at
+        print(f"📝 Summary for '{title}' ({len(summary)} chars): {summary}")
+
 def summarize_rss_articles():
     """Add AI summaries and Dutch titles to RSS articles in the content feed"""
     
-    # Load content feed
-    content_data, content_path = get_content_feed()
+    # Any write to the feed changes its mtime, so an unchanged feed that was
+    # fully summarized before needs no scan at all. Otherwise stream the feed:
+    # in the common case there is nothing to do and the full feed never needs
+    # to be materialized
+    if is_feed_fully_summarized():
+        print("ℹ️  All RSS articles already have AI summaries and Dutch titles")
+        return True
     
-    # Find RSS articles without summaries OR without Dutch titles
-    rss_articles = []
-    for item in content_data['items']:
-        if (item['source']['platform'] == 'rss' and 
-            ('ai_summary' not in item['content'] or 'dutch_title' not in item['content'])):
-            rss_articles.append(item)
+    # Without ijson the stream falls back to a full parse anyway: load the
+    # feed once and scan that instead of parsing it twice
+    if not HAVE_IJSON:
+        content_data, content_path = get_content_feed()
+        items = content_data['items']
+    else:
+        content_data = None
+        items = iter_feed_items(CONTENT_FEED_PATH)
     
-    if not rss_articles:
+    if not any(needs_processing(item) for item in items):
+        mark_feed_summarized()
         print("ℹ️  All RSS articles already have AI summaries and Dutch titles")
         return True
     
+    # Load content feed
+    if content_data is None:
+        content_data, content_path = get_content_feed()
+    
+    # Find RSS articles without summaries OR without Dutch titles
+    rss_articles = [item for item in content_data['items'] if needs_processing(item)]
+    
     print(f"🤖 Found {len(rss_articles)} RSS articles to process")
     
-    # Process each article
+    # One timestamp for the whole batch: it is logically a single run
+    run_timestamp = datetime.now().isoformat()
+    
+    # Process articles concurrently: each one is a few network-bound
+    # OpenRouter round-trips, so overlapping them is a near-linear speedup
     processed_count = 0
-    for article in rss_articles:
-        try:
-            print(f"\n📰 Processing: {article['content']['title']}")
-            
-            # Generate Dutch title if missing
-            if 'dutch_title' not in article['content']:
-                print("🔤 Translating title to Dutch...")
-                dutch_title = translate_title_with_openrouter(article['content']['title'])
-                article['content']['dutch_title'] = dutch_title
-                print(f"✅ Dutch title: {dutch_title}")
-            
-            # Generate summary if missing
-            if 'ai_summary' not in article['content']:
-                print("📝 Generating AI summary...")
-                summary = summarize_with_openrouter(
-                    article['content']['title'],
-                    article['content']['description']
-                )
-                
-                if len(summary) > 400:
-                    print(f"⚠️  Warning: Summary is {len(summary)} chars (over 400 limit)")
-                
-                article['content']['ai_summary'] = summary
-                article['metadata']['summarized_at'] = datetime.now().isoformat()
-                print(f"✅ Summary ({len(summary)} chars): {summary}")
-            
-            processed_count += 1
-            
-        except Exception as e:
-            print(f"❌ Error processing article '{article['content']['title']}': {e}")
-            continue
+    max_workers = min(MAX_CONCURRENT_REQUESTS, len(rss_articles))
+    print(f"🚀 Running up to {max_workers} articles in parallel")
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(process_rss_article, article, run_timestamp): article for article in rss_articles}
+        
+        for future in as_completed(futures):
+            article = futures[future]
+            try:
+                future.result()
+                processed_count += 1
+            except Exception as e:
+                print(f"❌ Error processing article '{article['content']['title']}': {e}")
     
     if processed_count > 0:
         # Save updated content feed
-        save_content_feed(content_data, content_path)
+        save_content_feed(content_data, content_path, run_timestamp)
+        
+        if processed_count == len(rss_articles):
+            mark_feed_summarized()
         
         print(f"\n🎉 Task 2.2 ENHANCED SUCCESS!")
         print(f"📊 Processed {processed_count} RSS articles")
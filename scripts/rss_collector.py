@@ -7,12 +7,31 @@ This script fetches articles from RSS feeds and saves them to JSON files
 in a format compatible with the unified content feed.
 """
 
-import json
+import html
+import re
 import requests
-import xml.etree.ElementTree as ET
+import threading
+import urllib3
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from hashlib import md5
 from pathlib import Path
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _jsonio import load_feed, save_feed
+
+# Matches any HTML tag in feed descriptions
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# lxml parses in C and is much faster; fall back to the stdlib parser
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
 
 class RSSCollector:
     def __init__(self):
@@ -23,69 +42,200 @@ class RSSCollector:
         self.headers = {
             'User-Agent': 'FocusFerry/1.0 (News Aggregator; https://hgnrs.nl)'
         }
+        
+        # Shared keep-alive session: feeds on the same host reuse the TCP+TLS
+        # connection, and transient server errors are retried with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # HTTP cache validators per feed URL (ETag / Last-Modified), used to
+        # make conditional requests so unchanged feeds come back as 304
+        self.http_cache_file = self.output_dir / '.cache.json'
+        self.http_cache = load_feed(self.http_cache_file) if self.http_cache_file.exists() else {}
+        self._http_cache_lock = threading.Lock()
     
-    def fetch_rss_feed(self, feed_url, max_items=10):
+    def _iterparse(self, source):
+        """Incremental (start, end) event parser over a file-like XML source"""
+        if HAVE_LXML:
+            # Tolerate slightly broken feeds, but never resolve entities or
+            # fetch anything over the network (XXE)
+            return ET.iterparse(source, events=('start', 'end'), recover=True,
+                                resolve_entities=False, no_network=True)
+        return ET.iterparse(source, events=('start', 'end'))
+    
+    def parse_rss_stream(self, source, max_items=10):
+        """
+        Incrementally parse an RSS document, stopping after max_items items
+        once the channel title and link have been seen (RSS does not fix
+        their position, so they may follow the items)
+        
+        Args:
+            source: File-like object with the raw RSS XML
+            max_items (int): Maximum number of items to read
+            
+        Returns:
+            tuple: (channel_fields, items) - channel-level elements by tag
+                (title, link) and the first max_items <item> elements
+        """
+        channel_depth = None
+        channel_fields = {}
+        items = []
+        depth = 0
+        
+        for event, elem in self._iterparse(source):
+            if event == 'start':
+                depth += 1
+                if channel_depth is None and elem.tag == 'channel':
+                    channel_depth = depth
+                continue
+            
+            # 'end' event: elem is complete and sits at the current depth
+            if channel_depth is not None and depth == channel_depth + 1:
+                if elem.tag == 'item':
+                    if len(items) < max_items:
+                        items.append(elem)
+                    else:
+                        # Surplus item: only still reading for the channel fields
+                        elem.clear()
+                elif elem.tag in ('title', 'link'):
+                    channel_fields.setdefault(elem.tag, elem)
+                
+                if len(items) >= max_items and len(channel_fields) == 2:
+                    # Everything needed: stop without reading the rest of the feed
+                    break
+            depth -= 1
+        
+        if channel_depth is None:
+            raise ValueError("Invalid RSS feed - no channel element found")
+        
+        return channel_fields, items
+    
+    def _conditional_headers(self, feed_url, max_items):
+        """Build If-None-Match / If-Modified-Since headers from cached validators"""
+        validators = self.http_cache.get(feed_url, {})
+        
+        # The saved file only holds max_items articles of the version the
+        # validators describe: a different limit needs a full fetch
+        if validators.get('max_items') != max_items:
+            return {}
+        
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+    
+    def _remember_validators(self, feed_url, validators):
+        """Store validators from fetch_rss_feed for the next conditional request
+        
+        Only call this once the articles they describe are saved, otherwise
+        a later 304 would keep an outdated file.
+        """
+        with self._http_cache_lock:
+            if self.http_cache.get(feed_url) == validators:
+                return
+            
+            if validators.get('etag') or validators.get('last_modified'):
+                self.http_cache[feed_url] = validators
+            elif self.http_cache.pop(feed_url, None) is None:
+                return
+            
+            save_feed(self.http_cache_file, self.http_cache)
+    
+    def fetch_rss_feed(self, feed_url, max_items=10, conditional=False, collected_at=None):
         """
         Fetch and parse RSS feed
         
         Args:
             feed_url (str): URL of the RSS feed
             max_items (int): Maximum number of articles to fetch
+            conditional (bool): Send cached validators, so an unchanged feed
+                is answered with 304 Not Modified instead of a full download
+            collected_at (str): ISO timestamp stamped on every article
+                (defaults to now)
             
         Returns:
-            list: List of article dictionaries
+            tuple: (articles, validators)
+                articles: list of article dictionaries, or None if the feed
+                    is unchanged since the last fetch (conditional requests only)
+                validators: ETag / Last-Modified of this response, for
+                    _remember_validators once the articles are saved (or None)
         """
         try:
             print(f"🔍 Fetching RSS feed: {feed_url}")
             
-            # Fetch RSS content
-            response = requests.get(feed_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            
-            # Parse XML
-            root = ET.fromstring(response.content)
-            
-            # Find channel info
-            channel = root.find('channel')
-            if channel is None:
-                raise ValueError("Invalid RSS feed - no channel element found")
+            # Fetch RSS content, streamed straight into the XML parser so
+            # parsing overlaps the download
+            headers = self._conditional_headers(feed_url, max_items) if conditional else {}
+            with self.session.get(feed_url, headers=headers, timeout=30, stream=True) as response:
+                if response.status_code == 304:
+                    print("♻️  Feed not modified since last fetch")
+                    return None, None
+                
+                response.raise_for_status()
+                
+                # Parse XML (undo any gzip/deflate transfer encoding on the fly)
+                response.raw.decode_content = True
+                channel_fields, items = self.parse_rss_stream(response.raw, max_items)
             
             # Extract channel metadata
-            channel_title = self.get_text(channel.find('title'), 'Unknown Source')
-            channel_description = self.get_text(channel.find('description'), '')
-            channel_link = self.get_text(channel.find('link'), '')
+            channel_title = self.get_text(channel_fields.get('title'), 'Unknown Source')
+            channel_link = self.get_text(channel_fields.get('link'), '')
             
             print(f"📰 Channel: {channel_title}")
             
+            # Values shared by every article of this feed: compute them once
+            domain = urlparse(channel_link).netloc if channel_link else 'unknown'
+            collected_at = collected_at or datetime.now().isoformat()
+            
             # Extract articles
             articles = []
-            items = channel.findall('item')[:max_items]
-            
             for item in items:
-                article = self.parse_rss_item(item, channel_title, channel_link)
+                article = self.parse_rss_item(item, channel_title, channel_link, domain, collected_at)
                 if article:
                     articles.append(article)
             
             print(f"✅ Parsed {len(articles)} articles")
-            return articles
             
-        except requests.RequestException as e:
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'max_items': max_items
+            }
+            
+            return articles, validators
+            
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
             print(f"❌ Network error fetching RSS feed: {e}")
-            return []
+            return [], None
         except ET.ParseError as e:
             print(f"❌ XML parsing error: {e}")
-            return []
+            return [], None
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
-            return []
+            return [], None
     
-    def parse_rss_item(self, item, channel_title, channel_link):
+    def parse_rss_item(self, item, channel_title, channel_link, domain, collected_at):
         """Parse a single RSS item into our article format"""
         try:
-            title = self.get_text(item.find('title'), 'Untitled')
-            link = self.get_text(item.find('link'), '')
-            description = self.get_text(item.find('description'), '')
-            pub_date = self.get_text(item.find('pubDate'), '')
+            # Index the item's children in one pass instead of one find() scan
+            # per field (first occurrence wins, same as find())
+            fields = {}
+            for child in item:
+                fields.setdefault(child.tag, child)
+            
+            title = self.get_text(fields.get('title'), 'Untitled')
+            link = self.get_text(fields.get('link'), '')
+            description = self.get_text(fields.get('description'), '')
+            pub_date = self.get_text(fields.get('pubDate'), '')
             
             # Try to parse publication date
             published_at = self.parse_date(pub_date)
@@ -97,19 +247,18 @@ class RSSCollector:
             if len(clean_description) > 300:
                 clean_description = clean_description[:297] + '...'
             
-            # Extract domain from channel link for source identification
-            domain = urlparse(channel_link).netloc if channel_link else 'unknown'
-            
+            # get_text already strips; only the cleaned description can
+            # pick up new edge whitespace from removed tags
             article = {
                 'article_id': self.generate_article_id(link),
-                'title': title.strip(),
+                'title': title,
                 'description': clean_description.strip(),
-                'url': link.strip(),
+                'url': link,
                 'published_at': published_at,
-                'source_title': channel_title.strip(),
-                'source_url': channel_link.strip(),
+                'source_title': channel_title,
+                'source_url': channel_link,
                 'source_domain': domain,
-                'collected_at': datetime.now().isoformat()
+                'collected_at': collected_at
             }
             
             return article
@@ -126,16 +275,8 @@ class RSSCollector:
     
     def clean_html(self, text):
         """Basic HTML tag removal"""
-        import re
-        # Remove HTML tags
-        clean = re.sub(r'<[^>]+>', '', text)
-        # Replace HTML entities
-        clean = clean.replace('&amp;', '&')
-        clean = clean.replace('&lt;', '<')
-        clean = clean.replace('&gt;', '>')
-        clean = clean.replace('&quot;', '"')
-        clean = clean.replace('&#39;', "'")
-        return clean
+        # Remove HTML tags, then decode all named/numeric entities in one pass
+        return html.unescape(_TAG_RE.sub('', text))
     
     def parse_date(self, date_string):
         """Parse RSS date string to ISO format"""
@@ -144,16 +285,14 @@ class RSSCollector:
         
         try:
             # Try common RSS date formats
-            import email.utils
-            timestamp = email.utils.parsedate_to_datetime(date_string)
+            timestamp = parsedate_to_datetime(date_string)
             return timestamp.isoformat()
-        except:
+        except (TypeError, ValueError):
             # Fallback to current time if parsing fails
             return datetime.now().isoformat()
     
     def generate_article_id(self, url):
         """Generate a unique ID for the article based on URL"""
-        import hashlib
         if not url:
             return f"rss_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
@@ -166,23 +305,22 @@ class RSSCollector:
                 return article_id.replace('.html', '').replace('.php', '')
         
         # Fallback: hash the URL
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
+        url_hash = md5(url.encode()).hexdigest()[:12]
         return f"rss_{url_hash}"
     
-    def save_articles_to_json(self, articles, source_name):
+    def save_articles_to_json(self, articles, source_name, collected_at=None):
         """Save articles to JSON file"""
         filename = f"{source_name}_articles.json"
         output_file = self.output_dir / filename
         
         data = {
-            'collected_at': datetime.now().isoformat(),
+            'collected_at': collected_at or datetime.now().isoformat(),
             'source_name': source_name,
             'total_articles': len(articles),
             'articles': articles
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_feed(output_file, data)
         
         print(f"💾 Saved {len(articles)} articles to {output_file}")
         return output_file
@@ -201,15 +339,29 @@ class RSSCollector:
         """
         print(f"🚀 Starting RSS collection for: {source_name}")
         
+        # Only ask for a 304 when there is a previous JSON file to fall back on
+        output_file = self.output_dir / f"{source_name}_articles.json"
+        
+        # One collection run is one instant: the articles and the file share it
+        collected_at = datetime.now().isoformat()
+        
         # Fetch articles
-        articles = self.fetch_rss_feed(feed_url, max_items)
+        articles, validators = self.fetch_rss_feed(feed_url, max_items, conditional=output_file.exists(),
+                                                   collected_at=collected_at)
+        
+        if articles is None:
+            print(f"✅ {source_name} unchanged, keeping {output_file}")
+            return output_file
         
         if not articles:
             print(f"❌ No articles collected from {source_name}")
             return None
         
         # Save to JSON
-        output_file = self.save_articles_to_json(articles, source_name)
+        output_file = self.save_articles_to_json(articles, source_name, collected_at)
+        
+        # Only now that the file is saved may a 304 fall back on it
+        self._remember_validators(feed_url, validators)
         
         print(f"\n🎉 Task 2.1 Progress: RSS collection successful!")
         print(f"📊 Collected {len(articles)} articles from {source_name}")
@@ -6,7 +6,9 @@ Configuration-driven collector that handles both RSS feeds and YouTube channels
 This replaces the hardcoded approaches with a flexible, configuration-based system.
 """
 
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -19,6 +21,12 @@ from youtube_collector import YouTubeCollector
 from content_integrator import integrate_rss_to_content_feed
 from content_summarizer import summarize_rss_articles
 
+# Upper bound on RSS feeds fetched at the same time
+MAX_PARALLEL_FEEDS = 8
+
+# Runs of characters that are not safe in a source/file name
+_NORM_RE = re.compile(r'[^a-zA-Z0-9]+')
+
 class UnifiedContentCollector:
     """Configuration-driven content collector for all sources"""
     
@@ -34,8 +42,15 @@ class UnifiedContentCollector:
             print(f"⚠️  YouTube API not available: {e}")
             self.youtube_collector = None
     
-    def collect_all_content(self):
-        """Collect content from all enabled sources"""
+    def collect_all_content(self, after_rss=None):
+        """
+        Collect content from all enabled sources
+        
+        Args:
+            after_rss (callable): Optional follow-up run as soon as the RSS
+                feeds are collected, while YouTube collection may still be
+                running (it must not touch data/youtube/)
+        """
         print("🚀 Unified Content Collection")
         print("=" * 50)
         
@@ -45,19 +60,29 @@ class UnifiedContentCollector:
             'errors': []
         }
         
-        # Collect RSS feeds
+        # RSS and YouTube share no files, so both sources are collected at once
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            youtube_future = executor.submit(self._collect_youtube_stage)
+            results['rss_feeds'] = self._collect_rss_stage()
+            
+            if after_rss:
+                after_rss()
+            
+            results['youtube_channels'] = youtube_future.result()
+        
+        return results
+    
+    def _collect_rss_stage(self):
+        """Collect RSS feeds (pipeline stage)"""
         print("\n📰 RSS Feeds Collection")
         print("-" * 30)
-        rss_results = self._collect_rss_feeds()
-        results['rss_feeds'] = rss_results
-        
-        # Collect YouTube channels
+        return self._collect_rss_feeds()
+    
+    def _collect_youtube_stage(self):
+        """Collect YouTube channels (pipeline stage)"""
         print("\n📺 YouTube Channels Collection")
         print("-" * 30)
-        youtube_results = self._collect_youtube_channels()
-        results['youtube_channels'] = youtube_results
-        
-        return results
+        return self._collect_youtube_channels()
     
     def _collect_rss_feeds(self):
         """Collect from all enabled RSS feeds"""
@@ -69,46 +94,51 @@ class UnifiedContentCollector:
         
         print(f"📊 Found {len(enabled_feeds)} enabled RSS feeds")
         
-        results = []
-        for feed in enabled_feeds:
-            try:
-                print(f"\n🔍 Processing: {feed['name']}")
-                
-                # Use configured max_articles or default
-                max_articles = feed.get('max_articles', 10)
-                
-                # Collect articles
-                output_file = self.rss_collector.collect_from_feed(
-                    feed_url=feed['url'],
-                    source_name=self._normalize_source_name(feed['name']),
-                    max_items=max_articles
-                )
-                
-                if output_file:
-                    results.append({
-                        'name': feed['name'],
-                        'source_name': self._normalize_source_name(feed['name']),
-                        'file_path': output_file,
-                        'success': True
-                    })
-                    print(f"✅ Success: {feed['name']}")
-                else:
-                    print(f"❌ Failed: {feed['name']}")
-                    results.append({
-                        'name': feed['name'],
-                        'success': False,
-                        'error': 'Collection failed'
-                    })
-                    
-            except Exception as e:
-                print(f"❌ Error collecting {feed['name']}: {e}")
-                results.append({
+        # Feeds are independent and network-bound: fetch them concurrently so
+        # the total time is close to the slowest feed instead of the sum
+        max_workers = min(MAX_PARALLEL_FEEDS, len(enabled_feeds))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._collect_rss_feed, enabled_feeds))
+    
+    def _collect_rss_feed(self, feed):
+        """Collect a single RSS feed and return its result entry"""
+        try:
+            print(f"\n🔍 Processing: {feed['name']}")
+            
+            # Use configured max_articles or default
+            max_articles = feed.get('max_articles', 10)
+            source_name = self._normalize_source_name(feed['name'])
+            
+            # Collect articles
+            output_file = self.rss_collector.collect_from_feed(
+                feed_url=feed['url'],
+                source_name=source_name,
+                max_items=max_articles
+            )
+            
+            if output_file:
+                print(f"✅ Success: {feed['name']}")
+                return {
                     'name': feed['name'],
-                    'success': False,
-                    'error': str(e)
-                })
-        
-        return results
+                    'source_name': source_name,
+                    'file_path': output_file,
+                    'success': True
+                }
+            
+            print(f"❌ Failed: {feed['name']}")
+            return {
+                'name': feed['name'],
+                'success': False,
+                'error': 'Collection failed'
+            }
+                
+        except Exception as e:
+            print(f"❌ Error collecting {feed['name']}: {e}")
+            return {
+                'name': feed['name'],
+                'success': False,
+                'error': str(e)
+            }
     
     def _collect_youtube_channels(self):
         """Collect from all enabled YouTube channels"""
@@ -124,53 +154,44 @@ class UnifiedContentCollector:
         
         print(f"📊 Found {len(enabled_channels)} enabled YouTube channels")
         
+        identifiers = [channel.get('identifier', channel.get('channel_id')) for channel in enabled_channels]
+        outcomes = self.youtube_collector.collect_channels(
+            identifiers,
+            # Use configured max_videos or default
+            [channel.get('max_videos', 10) for channel in enabled_channels]
+        )
+        
         results = []
-        for channel in enabled_channels:
-            try:
-                print(f"\n🔍 Processing: {channel['name']}")
-                
-                # Use configured max_videos or default
-                max_videos = channel.get('max_videos', 10)
-                
-                # Collect videos using identifier or channel_id
-                identifier = channel.get('identifier', channel.get('channel_id'))
-                
-                output_file = self.youtube_collector.collect_from_channel(
-                    channel_identifier=identifier,
-                    max_results=max_videos
-                )
-                
-                if output_file:
-                    results.append({
-                        'name': channel['name'],
-                        'identifier': identifier,
-                        'file_path': output_file,
-                        'success': True
-                    })
-                    print(f"✅ Success: {channel['name']}")
-                else:
-                    print(f"❌ Failed: {channel['name']}")
-                    results.append({
-                        'name': channel['name'],
-                        'success': False,
-                        'error': 'Collection failed'
-                    })
-                    
-            except Exception as e:
-                print(f"❌ Error collecting {channel['name']}: {e}")
+        for channel, outcome in zip(enabled_channels, outcomes):
+            if outcome['success']:
+                print(f"✅ Success: {channel['name']}")
+                results.append({
+                    'name': channel['name'],
+                    'identifier': outcome['identifier'],
+                    'file_path': outcome['result'],
+                    'success': True
+                })
+            elif outcome['error']:
+                print(f"❌ Error collecting {channel['name']}: {outcome['error']}")
                 results.append({
                     'name': channel['name'],
                     'success': False,
-                    'error': str(e)
+                    'error': str(outcome['error'])
+                })
+            else:
+                print(f"❌ Failed: {channel['name']}")
+                results.append({
+                    'name': channel['name'],
+                    'success': False,
+                    'error': 'Collection failed'
                 })
         
         return results
     
     def _normalize_source_name(self, name: str) -> str:
         """Convert display name to file-safe source name"""
-        import re
         # Convert to lowercase, replace spaces/special chars with underscore
-        normalized = re.sub(r'[^a-zA-Z0-9]+', '_', name.lower())
+        normalized = _NORM_RE.sub('_', name.lower())
         # Remove leading/trailing underscores
         normalized = normalized.strip('_')
         return normalized
@@ -227,14 +248,21 @@ class UnifiedContentCollector:
         
         start_time = datetime.now()
         
-        # Step 1: Collect content
-        collection_results = self.collect_all_content()
+        steps = {}
         
-        # Step 2: Integrate content
-        integration_success = self.integrate_all_content()
-        
-        # Step 3: Generate summaries
-        summary_success = self.generate_summaries()
+        def process_rss():
+            # Step 2: Integrate content
+            steps['integration'] = self.integrate_all_content()
+            
+            # Step 3: Generate summaries
+            steps['summaries'] = self.generate_summaries()
+        
+        # Step 1: Collect content. Integration and summaries only read the RSS
+        # output, so they run while YouTube collection (data/youtube/) is
+        # still going in the background
+        collection_results = self.collect_all_content(after_rss=process_rss)
+        integration_success = steps['integration']
+        summary_success = steps['summaries']
         
         # Summary
         end_time = datetime.now()
@@ -7,185 +7,643 @@ This script uses the YouTube Data API v3 to fetch recent videos from a specified
 and saves the video metadata to a JSON file.
 """
 
-import json
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from googleapiclient.discovery import build
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _jsonio import load_feed, save_feed
 
 # Load environment variables
 load_dotenv()
 
+YOUTUBE_API_URL = 'https://www.googleapis.com/youtube/v3'
+
+# Upper bound on channels fetched at the same time
+MAX_PARALLEL_CHANNELS = 4
+
+# channels.list accepts at most this many comma-separated IDs per call
+CHANNELS_PER_REQUEST = 50
+
+# Channel identifier -> file name: drop '@' from handles, spaces become '_'
+_FILENAME_TRANS = str.maketrans({'@': None, ' ': '_'})
+
+# Channel IDs for common channels, keyed by lowercase identifier
+_KNOWN_CHANNELS = {
+    "fireship": "UCsBjURrPoezykLs9EqgamOA",
+    "matthew_berman": "UCawZsQWqfGSbCI5yjkdVkTA",  # Matthew Berman's AI channel
+    "matt_wolfe": "UChpleBmo18P08aKCIgti38g",  # Matt Wolfe (@mreflow) - AI News & Tech
+    "two_minute_papers": "UCbfYPyITQ-7l4upoX8nvctg",  # Two Minute Papers - AI Research
+}
+
+# Partial-response field masks: only the keys the collector actually reads
+CHANNEL_UPLOADS_FIELDS = 'items(id,contentDetails/relatedPlaylists/uploads)'
+PLAYLIST_ITEM_FIELDS = (
+    'items/snippet(resourceId/videoId,title,description,publishedAt,'
+    'channelTitle,channelId,thumbnails/medium/url),nextPageToken'
+)
+
+# playlistItems.list returns at most this many items per page
+PLAYLIST_PAGE_SIZE = 50
+
+# Output file for collect_from_channels (all channels in one file)
+AGGREGATE_FILENAME = 'all_videos.json'
+
+# Video descriptions longer than this are cut off (with '...') in the JSON
+DESCRIPTION_LIMIT = 200
+
+# API cache lifetimes in seconds: channel IDs and uploads playlists
+# practically never change, a channel's latest videos do
+CHANNEL_CACHE_TTL = 7 * 24 * 3600
+VIDEOS_CACHE_TTL = 3600
+
+# How long an expired response with an ETag is kept for revalidation; after
+# that it is dropped on load like any other expired entry
+ETAG_REVALIDATE_WINDOW = 24 * 3600
+
+# How long a checkpoint of a quota-interrupted fetch is kept (the daily
+# quota resets at midnight Pacific time)
+RESUME_CHECKPOINT_TTL = 2 * 24 * 3600
+
+# 403 error reasons that mean the daily API quota is used up
+QUOTA_ERROR_REASONS = ('quotaExceeded', 'dailyLimitExceeded')
+
+# Exit code when the quota ran out (EX_TEMPFAIL: retry later)
+EXIT_QUOTA_EXCEEDED = 75
+
+class QuotaExceededError(Exception):
+    """The YouTube Data API daily quota is used up
+    
+    page_token is the playlist page that could not be fetched, when the
+    error interrupted iter_channel_videos.
+    """
+    
+    def __init__(self, message, page_token=None):
+        super().__init__(message)
+        self.page_token = page_token
+
+def _thumbnail_url(snippet):
+    """Medium thumbnail URL of a playlistItems snippet, or '' if it has none"""
+    # Deleted and private videos come back without thumbnails at all
+    thumbnails = snippet.get('thumbnails')
+    medium = thumbnails.get('medium') if thumbnails else None
+    return medium.get('url', '') if medium else ''
+
 class YouTubeCollector:
     def __init__(self):
         self.api_key = os.getenv('YOUTUBE_API_KEY')
         if not self.api_key:
             raise ValueError("YOUTUBE_API_KEY not found in environment variables")
         
-        self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        self._resolved_channels = {}
+        
+        # Plain keep-alive session for the YouTube Data API REST endpoints:
+        # no discovery document, connections are reused across calls and
+        # threads, and responses can be revalidated by ETag
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=MAX_PARALLEL_CHANNELS,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        
         self.output_dir = Path(__file__).parent.parent / 'data' / 'youtube'
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # API responses cached with an expiry time, so repeat runs within the
+        # TTL spend no requests (or daily quota units) on unchanged data
+        self.api_cache_file = self.output_dir / '.cache.json'
+        self.api_cache = self._load_api_cache()
+        self._api_cache_lock = threading.Lock()
+    
+    def _load_api_cache(self):
+        """Load the API cache file, dropping expired entries
+        
+        Entries with an ETag stay a while longer (ETAG_REVALIDATE_WINDOW) so
+        they can still be revalidated with a cheap 304.
+        """
+        if not self.api_cache_file.exists():
+            return {}
+        
+        now = time.time()
+        return {key: entry for key, entry in load_feed(self.api_cache_file).items()
+                if entry['expires'] > (now - ETAG_REVALIDATE_WINDOW if entry.get('etag') else now)}
+    
+    def _cache_get(self, key):
+        """Return a cached API value, or None if missing or expired"""
+        entry = self.api_cache.get(key)
+        if entry and entry['expires'] > time.time():
+            return entry['value']
+        return None
+    
+    def _cache_update(self, values, ttl, etag=None):
+        """Cache several API values (key -> value) for ttl seconds
+        
+        etag is the ETag of the API response the values came from, used to
+        revalidate them once they expire.
+        """
+        if not values:
+            return
+        
+        expires = time.time() + ttl
+        with self._api_cache_lock:
+            for key, value in values.items():
+                entry = {'expires': expires, 'value': value}
+                if etag:
+                    entry['etag'] = etag
+                self.api_cache[key] = entry
+            save_feed(self.api_cache_file, self.api_cache)
+    
+    def _cache_delete(self, key):
+        """Drop one cached API value"""
+        with self._api_cache_lock:
+            if self.api_cache.pop(key, None) is not None:
+                save_feed(self.api_cache_file, self.api_cache)
+    
+    def clear_cache(self):
+        """Forget all cached API responses"""
+        with self._api_cache_lock:
+            self.api_cache = {}
+            self.api_cache_file.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _is_quota_error(response):
+        """Whether an API error response reports an exhausted quota"""
+        try:
+            errors = response.json()['error']['errors']
+        except (ValueError, KeyError, TypeError):
+            return False
+        return any(error.get('reason') in QUOTA_ERROR_REASONS for error in errors)
+    
+    def _get_json(self, endpoint, params, cache_key=None, ttl=None):
+        """
+        GET a YouTube Data API endpoint and return the parsed JSON response
+        
+        With a cache_key the response is cached for ttl seconds. Once it has
+        expired it is revalidated with If-None-Match, so an unchanged resource
+        comes back as an empty 304 instead of the full JSON body.
+        """
+        entry = self.api_cache.get(cache_key) if cache_key else None
+        if entry and entry['expires'] > time.time():
+            return entry['value']
+        
+        headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else {}
+        response = self.session.get(
+            f"{YOUTUBE_API_URL}/{endpoint}",
+            params={**params, 'key': self.api_key},
+            headers=headers,
+            timeout=30
+        )
+        
+        if response.status_code == 304:
+            body = entry['value']
+        else:
+            if response.status_code == 403 and self._is_quota_error(response):
+                raise QuotaExceededError(f"YouTube API quota exceeded ({endpoint})")
+            response.raise_for_status()
+            body = response.json()
+        
+        if cache_key:
+            self._cache_update({cache_key: body}, ttl, etag=response.headers.get('ETag'))
+        return body
     
     def get_channel_id_from_username(self, username):
         """Get channel ID from channel username/handle"""
+        cache_key = f"channel_id:{username}"
+        cached = self._cache_get(cache_key)
+        if cached:
+            return cached
+        
         try:
-            request = self.youtube.channels().list(
-                part='id',
-                forUsername=username
-            )
-            response = request.execute()
-            
-            if response['items']:
-                return response['items'][0]['id']
-            else:
-                # Try with @ handle format
-                search_request = self.youtube.search().list(
-                    part='snippet',
-                    q=username,
-                    type='channel',
-                    maxResults=1
-                )
-                search_response = search_request.execute()
+            # @handle and legacy username lookups cost 1 quota unit each;
+            # search.list costs 100, so it is only the last resort
+            channel_id = None
+            for lookup in ({'forHandle': username.lstrip('@')}, {'forUsername': username}):
+                response = self._get_json('channels', {
+                    'part': 'id',
+                    'fields': 'items/id',
+                    **lookup
+                })
                 
-                if search_response['items']:
-                    return search_response['items'][0]['snippet']['channelId']
+                # (the API leaves out 'items' entirely when nothing matches)
+                if response.get('items'):
+                    channel_id = response['items'][0]['id']
+                    break
+            
+            if channel_id is None:
+                # Search for the channel by name
+                search_response = self._get_json('search', {
+                    'part': 'snippet',
+                    'q': username,
+                    'type': 'channel',
+                    'maxResults': 1,
+                    'fields': 'items/snippet/channelId'
+                })
                 
-                raise ValueError(f"Channel not found: {username}")
+                if not search_response.get('items'):
+                    raise ValueError(f"Channel not found: {username}")
                 
+                channel_id = search_response['items'][0]['snippet']['channelId']
+            
+            self._cache_update({cache_key: channel_id}, CHANNEL_CACHE_TTL)
+            return channel_id
+            
+        except QuotaExceededError:
+            raise
         except Exception as e:
             print(f"Error finding channel {username}: {e}")
             return None
     
-    def get_channel_videos(self, channel_id, max_results=10):
-        """Fetch recent videos from a YouTube channel"""
+    def _batch_get_uploads_playlists(self, channel_ids):
+        """Map channel IDs to their uploads playlist IDs, 50 channels per API call"""
+        uploads = {}
+        missing = []
+        for channel_id in channel_ids:
+            cached = self._cache_get(f"uploads:{channel_id}")
+            if cached:
+                uploads[channel_id] = cached
+            else:
+                missing.append(channel_id)
+        
+        fetched = {}
         try:
-            # Get channel's uploads playlist ID
-            channel_request = self.youtube.channels().list(
-                part='contentDetails',
-                id=channel_id
-            )
-            channel_response = channel_request.execute()
+            for start in range(0, len(missing), CHANNELS_PER_REQUEST):
+                batch = missing[start:start + CHANNELS_PER_REQUEST]
+                response = self._get_json('channels', {
+                    'part': 'contentDetails',
+                    'id': ','.join(batch),
+                    'fields': CHANNEL_UPLOADS_FIELDS
+                })
+                
+                for item in response.get('items', []):
+                    fetched[item['id']] = item['contentDetails']['relatedPlaylists']['uploads']
             
-            if not channel_response['items']:
-                raise ValueError(f"Channel not found: {channel_id}")
+        except QuotaExceededError:
+            raise
+        except Exception as e:
+            print(f"Error fetching uploads playlists: {e}")
+        
+        self._cache_update({f"uploads:{channel_id}": playlist_id for channel_id, playlist_id in fetched.items()},
+                           CHANNEL_CACHE_TTL)
+        uploads.update(fetched)
+        return uploads
+    
+    def iter_channel_videos(self, channel_id, limit=None, uploads_playlist_id=None, page_token=None,
+                            seen_ids=None):
+        """
+        Yield a channel's most recent videos, newest first
+        
+        Follows nextPageToken through the uploads playlist, so any number of
+        videos can be fetched while only one page of results is held at a time.
+        
+        Args:
+            channel_id (str): YouTube channel ID
+            limit (int): Maximum number of videos, or None for all of them
+            uploads_playlist_id (str): The channel's uploads playlist, when it
+                was already looked up (see _batch_get_uploads_playlists)
+            page_token (str): Playlist page to start from (to resume a fetch)
+            seen_ids (set): IDs of videos the caller already has; they are
+                skipped, and every yielded ID is added to the set
             
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+        Raises:
+            QuotaExceededError: with the page_token of the page to resume from
+        """
+        # Get channel's uploads playlist ID
+        if uploads_playlist_id is None:
+            uploads_playlist_id = self._batch_get_uploads_playlists([channel_id]).get(channel_id)
+            if not uploads_playlist_id:
+                raise ValueError(f"Channel not found: {channel_id}")
+        
+        # One fetch is one instant: every video shares the timestamp
+        collected_at = datetime.now().isoformat()
+        
+        remaining = limit
+        
+        # Pages are cached (and expire) one by one and page tokens are offsets,
+        # so a cached page next to a fresh one can repeat a video that shifted
+        # across the page boundary: never yield the same video twice
+        seen_ids = set() if seen_ids is None else seen_ids
+        
+        while remaining is None or remaining > 0:
+            page_size = PLAYLIST_PAGE_SIZE if remaining is None else min(remaining, PLAYLIST_PAGE_SIZE)
+            params = {
+                'part': 'snippet',
+                'playlistId': uploads_playlist_id,
+                'maxResults': page_size,
+                'fields': PLAYLIST_ITEM_FIELDS
+            }
+            cache_key = f"playlist:{uploads_playlist_id}:{page_size}"
+            if page_token:
+                params['pageToken'] = page_token
+                cache_key += f":{page_token}"
             
             # Get videos from uploads playlist
-            playlist_request = self.youtube.playlistItems().list(
-                part='snippet',
-                playlistId=uploads_playlist_id,
-                maxResults=max_results
-            )
-            playlist_response = playlist_request.execute()
+            try:
+                page = self._get_json('playlistItems', params, cache_key=cache_key, ttl=VIDEOS_CACHE_TTL)
+            except QuotaExceededError as e:
+                e.page_token = page_token
+                raise
             
-            videos = []
-            for item in playlist_response['items']:
-                snippet = item['snippet']
-                video_data = {
-                    'video_id': snippet['resourceId']['videoId'],
-                    'title': snippet['title'],
-                    'description': snippet['description'][:200] + '...' if len(snippet['description']) > 200 else snippet['description'],
-                    'published_at': snippet['publishedAt'],
-                    'channel_title': snippet['channelTitle'],
-                    'channel_id': snippet['channelId'],
-                    'thumbnail_url': snippet['thumbnails'].get('medium', {}).get('url', ''),
-                    'collected_at': datetime.now().isoformat()
-                }
-                videos.append(video_data)
+            for item in page.get('items', []):
+                if remaining is not None and remaining <= 0:
+                    break
+                
+                video = self._video_data(item['snippet'], collected_at)
+                if video['video_id'] in seen_ids:
+                    continue
+                
+                seen_ids.add(video['video_id'])
+                if remaining is not None:
+                    remaining -= 1
+                yield video
             
-            return videos
+            page_token = page.get('nextPageToken')
+            if not page_token:
+                break
+    
+    def _video_data(self, snippet, collected_at):
+        """Convert a playlistItems snippet into our video format"""
+        description = snippet['description']
+        if len(description) > DESCRIPTION_LIMIT:
+            description = description[:DESCRIPTION_LIMIT] + '...'
+        
+        return {
+            'video_id': snippet['resourceId']['videoId'],
+            'title': snippet['title'],
+            'description': description,
+            'published_at': snippet['publishedAt'],
+            'channel_title': snippet['channelTitle'],
+            'channel_id': snippet['channelId'],
+            'thumbnail_url': _thumbnail_url(snippet),
+            'collected_at': collected_at
+        }
+    
+    def get_channel_videos(self, channel_id, max_results=10, uploads_playlist_id=None):
+        """Fetch recent videos from a YouTube channel
+        
+        uploads_playlist_id can be passed in when it was already looked up
+        (see _batch_get_uploads_playlists); otherwise it is fetched here.
+        
+        If the API quota runs out part-way, the videos fetched so far are
+        checkpointed and QuotaExceededError is raised; the next call for the
+        same channel resumes from the checkpoint instead of starting over.
+        """
+        resume_key = f"resume:{channel_id}:{max_results}"
+        checkpoint = self._cache_get(resume_key)
+        
+        if checkpoint:
+            print(f"⏯️  Resuming {channel_id} after {len(checkpoint['videos'])} videos")
+            videos = checkpoint['videos']
+            page_token = checkpoint['page_token']
+        else:
+            videos = []
+            page_token = None
+        
+        limit = max_results - len(videos) if max_results is not None else None
+        seen_ids = {video['video_id'] for video in videos}
+        
+        try:
+            for video in self.iter_channel_videos(channel_id, limit, uploads_playlist_id, page_token, seen_ids):
+                videos.append(video)
             
+        except QuotaExceededError as e:
+            # Only a failed playlist page tells where to resume; a quota error
+            # before paging started (e.g. on the uploads lookup) leaves any
+            # existing checkpoint as it is
+            if videos and e.page_token:
+                self._cache_update({resume_key: {'page_token': e.page_token, 'videos': videos}},
+                                   RESUME_CHECKPOINT_TTL)
+            raise
         except Exception as e:
             print(f"Error fetching videos from channel {channel_id}: {e}")
             return []
+        
+        if checkpoint:
+            self._cache_delete(resume_key)
+        return videos
     
     def save_videos_to_json(self, videos, filename):
-        """Save video data to JSON file"""
+        """Save video data (a list or any iterable, e.g. iter_channel_videos) to JSON file"""
         output_file = self.output_dir / filename
+        videos = list(videos)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'collected_at': datetime.now().isoformat(),
-                'total_videos': len(videos),
-                'videos': videos
-            }, f, indent=2, ensure_ascii=False)
+        save_feed(output_file, {
+            'collected_at': datetime.now().isoformat(),
+            'total_videos': len(videos),
+            'videos': videos
+        })
         
         print(f"✅ Saved {len(videos)} videos to {output_file}")
         return output_file
     
-    def collect_from_channel(self, channel_identifier, max_results=10):
-        """Main method to collect videos from a channel"""
-        print(f"🔍 Fetching videos from channel: {channel_identifier}")
+    def resolve_channel_id(self, channel_identifier):
+        """Resolve a known channel name, channel ID or username to a channel ID"""
+        if channel_identifier in self._resolved_channels:
+            return self._resolved_channels[channel_identifier]
         
         # Use known channel IDs for common channels
-        known_channels = {
-            "fireship": "UCsBjURrPoezykLs9EqgamOA",
-            "matthew_berman": "UCawZsQWqfGSbCI5yjkdVkTA",  # Matthew Berman's AI channel
-            "matt_wolfe": "UChpleBmo18P08aKCIgti38g",  # Matt Wolfe (@mreflow) - AI News & Tech
-            "two_minute_papers": "UCbfYPyITQ-7l4upoX8nvctg",  # Two Minute Papers - AI Research
-        }
+        known_id = _KNOWN_CHANNELS.get(channel_identifier.lower())
         
-        if channel_identifier.lower() in known_channels:
-            channel_id = known_channels[channel_identifier.lower()]
+        if known_id is not None:
+            channel_id = known_id
         elif channel_identifier.startswith('UC') and len(channel_identifier) == 24:
             # Already a channel ID
             channel_id = channel_identifier
         else:
             # Try to get channel ID from username
             channel_id = self.get_channel_id_from_username(channel_identifier)
-            if not channel_id:
-                return None
+        
+        if channel_id:
+            self._resolved_channels[channel_identifier] = channel_id
+        return channel_id
+    
+    def collect_from_channel(self, channel_identifier, max_results=10, uploads_playlist_id=None):
+        """Main method to collect videos from a channel"""
+        print(f"🔍 Fetching videos from channel: {channel_identifier}")
+        
+        channel_id = self.resolve_channel_id(channel_identifier)
+        if not channel_id:
+            return None
         
         print(f"📺 Channel ID: {channel_id}")
         
         # Fetch videos
-        videos = self.get_channel_videos(channel_id, max_results)
+        videos = self.get_channel_videos(channel_id, max_results, uploads_playlist_id)
         
         if videos:
             # Save to JSON file
-            filename = f"{channel_identifier.replace('@', '').replace(' ', '_')}_videos.json"
+            filename = f"{channel_identifier.translate(_FILENAME_TRANS)}_videos.json"
             output_file = self.save_videos_to_json(videos, filename)
             return output_file
         else:
             print("❌ No videos found")
             return None
+    
+    def collect_channels(self, channel_identifiers, max_results=10, save=True):
+        """
+        Collect several channels concurrently
+        
+        All channels are resolved first, so their uploads playlists are looked
+        up in one batched channels.list call; the channels are then fetched in
+        parallel (at most MAX_PARALLEL_CHANNELS at a time).
+        
+        Args:
+            channel_identifiers (list): Channel names, IDs or usernames
+            max_results (int or list): Videos per channel, or one limit per channel
+            save (bool): Save each channel to its own JSON file, like
+                collect_from_channel; otherwise return the videos
+            
+        Returns:
+            list: One entry per channel, in order: {'identifier', 'success',
+                'result' (saved file path, or list of videos), 'error'
+                (the exception that stopped the channel, if any)}
+        """
+        if not channel_identifiers:
+            return []
+        
+        if isinstance(max_results, (list, tuple)):
+            limits = list(max_results)
+        else:
+            limits = [max_results] * len(channel_identifiers)
+        
+        try:
+            channel_ids = [self.resolve_channel_id(identifier) if identifier else None
+                           for identifier in channel_identifiers]
+            uploads = self._batch_get_uploads_playlists([cid for cid in channel_ids if cid])
+        except QuotaExceededError as e:
+            # Each channel below then reports the quota error itself
+            print(f"⚠️  {e}")
+            channel_ids = [None] * len(channel_identifiers)
+            uploads = {}
+        
+        def collect(identifier, channel_id, limit):
+            try:
+                if save:
+                    result = self.collect_from_channel(identifier, limit, uploads.get(channel_id))
+                else:
+                    channel_id = channel_id or self.resolve_channel_id(identifier)
+                    result = self.get_channel_videos(channel_id, limit, uploads.get(channel_id)) if channel_id else None
+                return {'identifier': identifier, 'success': bool(result), 'result': result, 'error': None}
+                
+            except Exception as e:
+                return {'identifier': identifier, 'success': False, 'result': None, 'error': e}
+        
+        # Channels are independent and network-bound: fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CHANNELS, len(channel_identifiers))) as executor:
+            return list(executor.map(collect, channel_identifiers, channel_ids, limits))
+    
+    def collect_from_channels(self, channel_identifiers, max_results=10, filename=AGGREGATE_FILENAME):
+        """Collect videos from several channels into a single JSON file"""
+        print(f"🔍 Fetching videos from {len(channel_identifiers)} channels")
+        
+        results = self.collect_channels(channel_identifiers, max_results, save=False)
+        
+        videos = [video for result in results if result['success'] for video in result['result']]
+        
+        if videos:
+            output_file = self.save_videos_to_json(videos, filename)
+        else:
+            print("❌ No videos found")
+            output_file = None
+        
+        # Out of quota: keep what the other channels collected, then let main() exit
+        _raise_quota_error(results)
+        
+        return output_file
+
+def _raise_quota_error(results):
+    """Re-raise a QuotaExceededError from collect_channels results, if any"""
+    for result in results:
+        if isinstance(result['error'], QuotaExceededError):
+            raise result['error']
+
+# Task 1.5: Multiple channels
+DEFAULT_CHANNELS = [
+    "matthew_berman",  # Matthew Berman AI
+    "matt_wolfe",      # Matt Wolfe - AI News  
+    "two_minute_papers"  # Two Minute Papers - AI Research
+]
+
+def run_single(collector, channel, max_results=10):
+    """Collect videos from one YouTube channel (Task 1.1)"""
+    result = collector.collect_from_channel(channel, max_results=max_results)
+    
+    if result:
+        print(f"\n🎉 Collected from {channel}: {result}")
+    else:
+        print(f"❌ Failed to collect from {channel}")
+    
+    return result
+
+def run_batch(collector, channels, max_results=10):
+    """Collect videos from multiple YouTube channels (Task 1.5)"""
+    results = collector.collect_channels(channels, max_results)
+    
+    all_results = []
+    
+    for channel, result in zip(channels, results):
+        if result['success']:
+            all_results.append(result['result'])
+            print(f"✅ Successfully collected from {channel}")
+        elif result['error']:
+            print(f"❌ Failed to collect from {channel}: {result['error']}")
+        else:
+            print(f"❌ Failed to collect from {channel}")
+    
+    if all_results:
+        print(f"\n🎉 Task 1.5 SUCCESS!")
+        print(f"Collected from {len(all_results)} channels:")
+        for result in all_results:
+            print(f"  - {result}")
+        print(f"Next: Task 2.1 - RSS feed collection")
+    else:
+        print("❌ Task 1.5 FAILED - No videos collected from any channel")
+    
+    # Out of quota: report what did get collected, then let main() exit
+    _raise_quota_error(results)
+    
+    return all_results
 
 def main():
-    """Collect videos from multiple YouTube channels for Task 1.5"""
+    """
+    Collect YouTube videos
+    
+    Usage: youtube_collector.py [--no-cache] [--aggregate] [channel ...]
+    One channel runs a single collection; none or several run a batch
+    (the Task 1.5 channels by default). --aggregate writes all channels'
+    videos to one file instead of one file per channel.
+    """
     try:
         collector = YouTubeCollector()
         
-        # Task 1.5: Multiple channels
-        channels = [
-            "matthew_berman",  # Matthew Berman AI
-            "matt_wolfe",      # Matt Wolfe - AI News  
-            "two_minute_papers"  # Two Minute Papers - AI Research
-        ]
+        args = sys.argv[1:]
+        if '--no-cache' in args:
+            print("🧹 Clearing YouTube API cache")
+            collector.clear_cache()
         
-        all_results = []
+        channels = [arg for arg in args if not arg.startswith('--')]
         
-        for channel in channels:
-            print(f"\n🔍 Processing channel: {channel}")
-            result = collector.collect_from_channel(channel, max_results=10)
-            
+        if '--aggregate' in args:
+            result = collector.collect_from_channels(channels or DEFAULT_CHANNELS)
             if result:
-                all_results.append(result)
-                print(f"✅ Successfully collected from {channel}")
-            else:
-                print(f"❌ Failed to collect from {channel}")
-        
-        if all_results:
-            print(f"\n🎉 Task 1.5 SUCCESS!")
-            print(f"Collected from {len(all_results)} channels:")
-            for result in all_results:
-                print(f"  - {result}")
-            print(f"Next: Task 2.1 - RSS feed collection")
+                print(f"\n🎉 Collected all channels into: {result}")
+        elif len(channels) == 1:
+            run_single(collector, channels[0])
         else:
-            print("❌ Task 1.5 FAILED - No videos collected from any channel")
+            run_batch(collector, channels or DEFAULT_CHANNELS)
             
+    except QuotaExceededError as e:
+        print(f"⏸️  {e}")
+        print("Progress is checkpointed; rerun after the daily quota resets to resume")
+        sys.exit(EXIT_QUOTA_EXCEEDED)
     except ValueError as e:
         print(f"❌ Configuration error: {e}")
         print("Please set YOUTUBE_API_KEY in your .env file")